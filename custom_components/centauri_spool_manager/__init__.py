@@ -28,9 +28,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         "dashboards_dir": integration_dir / "dashboards",
     }
 
-    _LOGGER.info(f"Integration directory: {integration_dir}")
-    _LOGGER.info(f"Packages directory: {integration_dir / 'packages'}")
-    _LOGGER.info(f"Dashboards directory: {integration_dir / 'dashboards'}")
+    _LOGGER.info("Integration directory: %s", integration_dir)
+    _LOGGER.info("Packages directory: %s", hass.data[DOMAIN]["packages_dir"])
+    _LOGGER.info("Dashboards directory: %s", hass.data[DOMAIN]["dashboards_dir"])
 
     return True
 
@@ -40,20 +40,20 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     _LOGGER.info("Centauri Carbon Spool Manager: Setting up from config entry")
 
     # Get integration paths
-    data = hass.data.get(DOMAIN, {})
+    data = hass.data.setdefault(DOMAIN, {})
     packages_dir = data.get("packages_dir")
 
-    if packages_dir and packages_dir.exists():
-        _LOGGER.info(f"Packages are available at: {packages_dir}")
+    # Path.exists() stats the filesystem; keep it off the event loop
+    if packages_dir and await hass.async_add_executor_job(packages_dir.exists):
+        _LOGGER.info("Packages are available at: %s", packages_dir)
         _LOGGER.info("Add this to your configuration.yaml:")
-        _LOGGER.info(f"  homeassistant:")
-        _LOGGER.info(f"    packages: !include_dir_merge_named {packages_dir}")
+        _LOGGER.info("  homeassistant:")
+        _LOGGER.info("    packages: !include_dir_merge_named %s", packages_dir)
     else:
         _LOGGER.warning("Packages directory not found")
 
     # Store config entry
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN]["entry"] = entry
+    data["entry"] = entry
 
     return True
 
@@ -14,6 +14,8 @@ from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+STEP_USER_DATA_SCHEMA = vol.Schema({})
+
 
 class CentauriSpoolManagerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Centauri Carbon Spool Manager."""
@@ -36,7 +38,7 @@ class CentauriSpoolManagerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema({}),
+            data_schema=STEP_USER_DATA_SCHEMA,
             description_placeholders={
                 "docs_url": "https://github.com/harpua555/Centauri-Carbon-Spool-Manager"
             },